@@ -18,10 +18,13 @@ from engine.spec import (
 from engine.dataset import (
     Case,
     load_dataset_jsonl,
+    iter_dataset_jsonl,
     DatasetLoadError,
 )
 from engine.jsonpath import (
     eval_jsonpath,
+    compile_jsonpath,
+    CompiledJSONPath,
     JSONPathError,
 )
 from engine.extraction import (
@@ -34,10 +37,12 @@ from engine.metrics import (
 )
 from engine.aggregation import (
     aggregate_mean,
+    aggregate_mean_counts,
 )
 from engine.systems import (
     SystemConfig,
     invoke_case,
+    close_shared_client,
     InvokeError,
 )
 from engine.results import (
@@ -59,9 +64,12 @@ __all__ = [
     # Dataset
     "Case",
     "load_dataset_jsonl",
+    "iter_dataset_jsonl",
     "DatasetLoadError",
     # JSONPath
     "eval_jsonpath",
+    "compile_jsonpath",
+    "CompiledJSONPath",
     "JSONPathError",
     # Extraction
     "extract_output",
@@ -71,9 +79,11 @@ __all__ = [
     "MetricError",
     # Aggregation
     "aggregate_mean",
+    "aggregate_mean_counts",
     # Systems
     "SystemConfig",
     "invoke_case",
+    "close_shared_client",
     "InvokeError",
     # Results
     "ErrorInfo",
@@ -9,6 +9,7 @@ In v1-min, only the mean aggregation is supported.
 
 __all__ = [
     "aggregate_mean",
+    "aggregate_mean_counts",
 ]
 
 
@@ -43,9 +44,34 @@ def aggregate_mean(values: list[bool]) -> float:
         >>> aggregate_mean([])
         0.0
     """
-    if not values:
+    # Python booleans are integers (True=1, False=0), so sum works directly
+    return aggregate_mean_counts(sum(values), len(values))
+
+
+def aggregate_mean_counts(true_count: int, total: int) -> float:
+    """
+    Compute the mean of boolean metric values from pre-tallied counts.
+    
+    Equivalent to aggregate_mean() for callers that count True values
+    while iterating, avoiding the need to materialize a list of booleans.
+    
+    Args:
+        true_count: Number of True metric values
+        total: Total number of metric values
+        
+    Returns:
+        Mean as a float between 0.0 and 1.0.
+        Returns 0.0 if total is zero (no valid cases).
+    
+    Examples:
+        >>> aggregate_mean_counts(2, 3)
+        0.6666666666666666
+        
+        >>> aggregate_mean_counts(0, 0)
+        0.0
+    """
+    if not total:
         return 0.0
     
-    # Python booleans are integers (True=1, False=0), so sum works directly
-    return sum(values) / len(values)
+    return true_count / total
 
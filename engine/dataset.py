@@ -6,14 +6,16 @@ and validate datasets from JSONL files.
 """
 
 import json
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
 
 __all__ = [
     "Case",
     "load_dataset_jsonl",
+    "iter_dataset_jsonl",
     "DatasetLoadError",
 ]
 
@@ -26,8 +28,12 @@ class Case(BaseModel):
     - id: Unique identifier for the case
     - input: Structured JSON input provided to the system under test
     - reference: Structured JSON reference output used for scoring
+    
+    Cases are immutable once loaded; unknown top-level keys are ignored.
     """
     
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     id: str = Field(..., min_length=1, description="Unique identifier for the case")
     input: dict[str, Any] = Field(..., description="Structured input for the system under test")
     reference: dict[str, Any] = Field(..., description="Reference output for scoring")
@@ -42,6 +48,10 @@ class Case(BaseModel):
         return self
 
 
+# Bound once so the per-line loop calls pydantic-core directly
+_CASE_VALIDATOR = Case.__pydantic_validator__
+
+
 class DatasetLoadError(Exception):
     """Raised when a dataset cannot be loaded or validated."""
     pass
@@ -62,6 +72,27 @@ def load_dataset_jsonl(path: str | Path) -> list[Case]:
     Returns:
         List of validated Case objects
         
+    Raises:
+        DatasetLoadError: If the file cannot be read or cases are invalid
+    """
+    return list(iter_dataset_jsonl(path))
+
+
+def iter_dataset_jsonl(path: str | Path) -> Iterator[Case]:
+    """
+    Lazily load and validate a dataset from a JSONL file.
+    
+    Like load_dataset_jsonl, but yields each case as soon as its line is
+    validated, so a run can start before the whole file has been read.
+    Errors are raised during iteration, when the offending line (or the
+    end of an empty file) is reached.
+    
+    Args:
+        path: Path to the JSONL dataset file
+        
+    Yields:
+        Validated Case objects, in file order
+        
     Raises:
         DatasetLoadError: If the file cannot be read or cases are invalid
     """
@@ -71,55 +102,62 @@ def load_dataset_jsonl(path: str | Path) -> list[Case]:
         raise DatasetLoadError(f"Dataset file not found: {path}")
     
     try:
-        content = path.read_text(encoding="utf-8")
+        f = path.open("rb")
     except Exception as e:
         raise DatasetLoadError(f"Failed to read dataset file: {e}") from e
     
-    cases: list[Case] = []
+    case_count = 0
     seen_ids: set[str] = set()
     
-    lines = content.strip().split("\n")
+    # Stream line by line so memory stays flat and parsing overlaps with I/O
+    with f:
+        for line_num, line in enumerate(f, start=1):
+            if line.isspace():
+                continue  # Skip empty lines
+            
+            # Parse JSON (ValueError also covers undecodable UTF-8 bytes);
+            # the surrounding whitespace and line ending are ignored
+            try:
+                data = json.loads(line)
+            except ValueError as e:
+                raise DatasetLoadError(
+                    f"Invalid JSON on line {line_num}: {e}"
+                ) from e
+            
+            # Validate with Pydantic (which also rejects non-object lines)
+            try:
+                case = _CASE_VALIDATOR.validate_python(data)
+            except ValidationError as e:
+                if _is_non_object_error(e):
+                    raise DatasetLoadError(
+                        f"Line {line_num}: Each line must be a JSON object"
+                    ) from e
+                raise DatasetLoadError(
+                    f"Invalid case on line {line_num}: {e}"
+                ) from e
+            except Exception as e:
+                raise DatasetLoadError(
+                    f"Invalid case on line {line_num}: {e}"
+                ) from e
+            
+            # Check for duplicate IDs (a single hash per case: add, then
+            # see whether the set grew)
+            seen_ids.add(case.id)
+            if len(seen_ids) == case_count:
+                raise DatasetLoadError(
+                    f"Duplicate case ID '{case.id}' on line {line_num}"
+                )
+            
+            case_count += 1
+            yield case
     
-    if not lines or (len(lines) == 1 and not lines[0].strip()):
+    if not case_count:
         raise DatasetLoadError("Dataset file is empty")
-    
-    for line_num, line in enumerate(lines, start=1):
-        line = line.strip()
-        if not line:
-            continue  # Skip empty lines
-        
-        # Parse JSON
-        try:
-            data = json.loads(line)
-        except json.JSONDecodeError as e:
-            raise DatasetLoadError(
-                f"Invalid JSON on line {line_num}: {e}"
-            ) from e
-        
-        if not isinstance(data, dict):
-            raise DatasetLoadError(
-                f"Line {line_num}: Each line must be a JSON object"
-            )
-        
-        # Validate with Pydantic
-        try:
-            case = Case.model_validate(data)
-        except Exception as e:
-            raise DatasetLoadError(
-                f"Invalid case on line {line_num}: {e}"
-            ) from e
-        
-        # Check for duplicate IDs
-        if case.id in seen_ids:
-            raise DatasetLoadError(
-                f"Duplicate case ID '{case.id}' on line {line_num}"
-            )
-        seen_ids.add(case.id)
-        
-        cases.append(case)
-    
-    if not cases:
-        raise DatasetLoadError("Dataset contains no valid cases")
-    
-    return cases
 
+
+def _is_non_object_error(error: ValidationError) -> bool:
+    """Check whether a validation error means the line itself was not a JSON object."""
+    return any(
+        detail["type"] == "model_type" and not detail["loc"]
+        for detail in error.errors()
+    )
@@ -7,7 +7,7 @@ using JSONPath expressions.
 
 from typing import Any
 
-from engine.jsonpath import eval_jsonpath, JSONPathError
+from engine.jsonpath import CompiledJSONPath, eval_jsonpath, JSONPathError
 
 __all__ = [
     "extract_output",
@@ -32,7 +32,7 @@ class ExtractionError(Exception):
         super().__init__(f"{self.code}: {message}")
 
 
-def extract_output(response_json: Any, output_json_path: str) -> Any:
+def extract_output(response_json: Any, output_json_path: str | CompiledJSONPath) -> Any:
     """
     Extract output from an HTTP response using a JSONPath expression.
     
@@ -41,7 +41,8 @@ def extract_output(response_json: Any, output_json_path: str) -> Any:
     
     Args:
         response_json: Parsed JSON response from the system under test
-        output_json_path: JSONPath expression to extract output (e.g., "$" or "$.answer")
+        output_json_path: JSONPath expression to extract output (e.g., "$" or "$.answer"),
+            or a precompiled path from compile_jsonpath()
         
     Returns:
         The extracted value at the specified path
@@ -60,10 +61,12 @@ def extract_output(response_json: Any, output_json_path: str) -> Any:
         {"answer": "4"}
     """
     try:
+        if isinstance(output_json_path, CompiledJSONPath):
+            return output_json_path(response_json)
         return eval_jsonpath(response_json, output_json_path)
     except JSONPathError as e:
         raise ExtractionError(
             message=str(e),
-            path=output_json_path,
+            path=str(output_json_path),
         ) from e
 
@@ -14,10 +14,13 @@ Not supported in v1-min:
 """
 
 import re
+from functools import lru_cache
 from typing import Any
 
 __all__ = [
     "eval_jsonpath",
+    "compile_jsonpath",
+    "CompiledJSONPath",
     "JSONPathError",
 ]
 
@@ -54,48 +57,119 @@ def eval_jsonpath(obj: Any, path: str) -> Any:
     if not isinstance(path, str):
         raise JSONPathError(f"JSONPath must be a string, got {type(path).__name__}")
     
-    path = path.strip()
+    return _traverse(obj, _parse_path(path.strip()))
+
+
+class CompiledJSONPath:
+    """
+    A validated JSONPath expression, callable on an object to evaluate it.
     
-    if not path:
-        raise JSONPathError("JSONPath cannot be empty")
+    Created by compile_jsonpath(). str() returns the original expression,
+    so compiled paths can be used wherever a path appears in a message.
+    """
     
-    if not path.startswith("$"):
-        raise JSONPathError(f"JSONPath must start with '$', got: {path}")
+    __slots__ = ("path", "_fields")
     
-    # Validate path format
-    if not _JSONPATH_PATTERN.match(path):
-        raise JSONPathError(f"Invalid JSONPath syntax: {path}")
+    def __init__(self, path: str, fields: tuple[str, ...]) -> None:
+        self.path = path
+        self._fields = fields
     
-    # Handle root case
-    if path == "$":
-        return obj
+    def __call__(self, obj: Any) -> Any:
+        return _traverse(obj, self._fields)
     
-    # Extract field names (skip the leading "$.")
-    fields = path[2:].split(".")
+    def __str__(self) -> str:
+        return self.path
     
-    # Traverse the object
-    current = obj
-    traversed = "$"
+    def __repr__(self) -> str:
+        return f"CompiledJSONPath({self.path!r})"
+
+
+def compile_jsonpath(path: str) -> CompiledJSONPath:
+    """
+    Compile a JSONPath expression into a reusable evaluator.
+    
+    The path is validated once up front; the returned object only
+    traverses its argument. Use this when the same path is applied to
+    many objects, e.g. once per case in a benchmark run.
     
-    for field in fields:
-        traversed = f"{traversed}.{field}"
+    Args:
+        path: A JSONPath expression (must start with $)
+        
+    Returns:
+        A CompiledJSONPath; call it with an object to get the value at
+        the path. It raises JSONPathError if the path cannot be resolved.
         
+    Raises:
+        JSONPathError: If the path is invalid
+    
+    Examples:
+        >>> get_answer = compile_jsonpath("$.answer")
+        >>> get_answer({"answer": "4"})
+        "4"
+    """
+    if not isinstance(path, str):
+        raise JSONPathError(f"JSONPath must be a string, got {type(path).__name__}")
+    
+    return CompiledJSONPath(path, _parse_path(path.strip()))
+
+
+def _traverse(obj: Any, fields: tuple[str, ...]) -> Any:
+    """Walk obj along the parsed field names, raising JSONPathError on failure."""
+    current = obj
+    
+    for index, field in enumerate(fields):
         if current is None:
             raise JSONPathError(
-                f"Cannot access '{field}' on null value at path: {traversed}"
+                f"Cannot access '{field}' on null value at path: {_traversed(fields, index)}"
             )
         
         if not isinstance(current, dict):
             raise JSONPathError(
-                f"Cannot access '{field}' on non-object type '{type(current).__name__}' at path: {traversed}"
+                f"Cannot access '{field}' on non-object type '{type(current).__name__}' at path: {_traversed(fields, index)}"
             )
         
         if field not in current:
             raise JSONPathError(
-                f"Field '{field}' not found at path: {traversed}"
+                f"Field '{field}' not found at path: {_traversed(fields, index)}"
             )
         
         current = current[field]
     
     return current
 
+
+@lru_cache(maxsize=256)
+def _parse_path(path: str) -> tuple[str, ...]:
+    """
+    Validate a JSONPath expression and split it into field names.
+    
+    Results are cached, since the same few paths from the benchmark spec
+    are evaluated for every case.
+    
+    Returns:
+        Tuple of field names to traverse (empty for the root path "$")
+        
+    Raises:
+        JSONPathError: If the path is empty or has invalid syntax
+    """
+    if not path:
+        raise JSONPathError("JSONPath cannot be empty")
+    
+    if not path.startswith("$"):
+        raise JSONPathError(f"JSONPath must start with '$', got: {path}")
+    
+    # Validate path format
+    if not _JSONPATH_PATTERN.match(path):
+        raise JSONPathError(f"Invalid JSONPath syntax: {path}")
+    
+    # Handle root case
+    if path == "$":
+        return ()
+    
+    # Extract field names (skip the leading "$.")
+    return tuple(path[2:].split("."))
+
+
+def _traversed(fields: tuple[str, ...], index: int) -> str:
+    """Format the path traversed up to and including fields[index], for error messages."""
+    return ".".join(("$",) + fields[:index + 1])
@@ -7,7 +7,7 @@ In v1-min, only the exact_match metric is supported.
 
 from typing import Any
 
-from engine.jsonpath import eval_jsonpath, JSONPathError
+from engine.jsonpath import CompiledJSONPath, eval_jsonpath, JSONPathError
 
 __all__ = [
     "score_exact_match",
@@ -30,6 +30,10 @@ class MetricError(Exception):
         super().__init__(f"{self.code}: {message}")
 
 
+# Characters removed from the end of a value when strip_punctuation is set
+_TRAILING_PUNCTUATION = ".!?,;:"
+
+
 def _normalize(value: Any, strip_punctuation: bool = False) -> str:
     """
     Normalize a value for comparison.
@@ -47,17 +51,20 @@ def _normalize(value: Any, strip_punctuation: bool = False) -> str:
     Returns:
         Normalized string representation
     """
-    result = str(value).lower().strip()
+    # Strings (the common case) skip the str() conversion. Stripping before
+    # lowercasing gives the same result but lowercases less text.
+    text = value if isinstance(value, str) else str(value)
+    result = text.strip().lower()
     if strip_punctuation:
-        result = result.rstrip(".!?,;:")
+        result = result.rstrip(_TRAILING_PUNCTUATION)
     return result
 
 
 def score_exact_match(
     extracted_output: Any,
     reference: dict[str, Any],
-    pred_path: str,
-    ref_path: str,
+    pred_path: str | CompiledJSONPath,
+    ref_path: str | CompiledJSONPath,
     strip_punctuation: bool = False,
 ) -> bool:
     """
@@ -74,7 +81,9 @@ def score_exact_match(
         extracted_output: The output extracted from the system response
         reference: The reference object from the case (case.reference)
         pred_path: JSONPath to extract predicted value from extracted_output
+            (a string or a precompiled path from compile_jsonpath())
         ref_path: JSONPath to extract reference value from reference
+            (a string or a precompiled path from compile_jsonpath())
         strip_punctuation: Whether to strip trailing punctuation before comparison
         
     Returns:
@@ -93,9 +102,14 @@ def score_exact_match(
         >>> score_exact_match({"value": "4"}, {"answer": "4"}, "$.value", "$.answer")
         True
     """
-    # Extract predicted value
+    # Extract predicted value ("$" is common and needs no traversal)
     try:
-        pred_value = eval_jsonpath(extracted_output, pred_path)
+        if pred_path == "$":
+            pred_value = extracted_output
+        elif isinstance(pred_path, CompiledJSONPath):
+            pred_value = pred_path(extracted_output)
+        else:
+            pred_value = eval_jsonpath(extracted_output, pred_path)
     except JSONPathError as e:
         raise MetricError(
             f"Failed to extract predicted value at '{pred_path}': {e}"
@@ -103,12 +117,21 @@ def score_exact_match(
     
     # Extract reference value
     try:
-        ref_value = eval_jsonpath(reference, ref_path)
+        if ref_path == "$":
+            ref_value = reference
+        elif isinstance(ref_path, CompiledJSONPath):
+            ref_value = ref_path(reference)
+        else:
+            ref_value = eval_jsonpath(reference, ref_path)
     except JSONPathError as e:
         raise MetricError(
             f"Failed to extract reference value at '{ref_path}': {e}"
         ) from e
     
+    # Identical strings normalize identically, so exact hits skip normalization
+    if type(pred_value) is str and type(ref_value) is str and pred_value == ref_value:
+        return True
+    
     # Normalize and compare
     normalized_pred = _normalize(pred_value, strip_punctuation)
     normalized_ref = _normalize(ref_value, strip_punctuation)
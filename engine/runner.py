@@ -5,13 +5,22 @@ This module implements the run_benchmark function that ties together
 all components: HTTP invocation, extraction, scoring, and aggregation.
 """
 
-from collections import Counter
-from datetime import datetime, timezone
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import json
+import threading
+import time
 from typing import Any
 
-from engine.aggregation import aggregate_mean
+import httpx
+
+from engine.aggregation import aggregate_mean_counts
 from engine.dataset import Case
 from engine.extraction import ExtractionError, extract_output
+from engine.jsonpath import CompiledJSONPath, JSONPathError, compile_jsonpath
 from engine.metrics import MetricError, score_exact_match
 from engine.results import CaseResult, ErrorInfo, RunResult, SystemResult
 from engine.spec import BenchmarkSpec
@@ -22,10 +31,107 @@ __all__ = [
 ]
 
 
+@dataclass(frozen=True, slots=True)
+class _RunPlan:
+    """Spec settings used for every case, resolved once per run."""
+    
+    output_json_path: CompiledJSONPath
+    metric_name: str
+    pred_path: CompiledJSONPath
+    ref_path: CompiledJSONPath
+    strip_punctuation: bool
+    primary_metric: str
+    aggregate_name: str
+    
+    @classmethod
+    def from_spec(cls, spec: BenchmarkSpec) -> "_RunPlan":
+        """
+        Resolve the plan from a spec (v1-min: one metric, one aggregate).
+        
+        Raises:
+            ValueError: If a JSONPath in the spec is invalid, which field
+                validation catches unless the spec bypassed it
+        """
+        metric_config = spec.scoring.metrics[0]
+        return cls(
+            output_json_path=_compile_path(
+                "contract.response.output_json_path",
+                spec.contract.response.output_json_path,
+            ),
+            metric_name=metric_config.name,
+            pred_path=_compile_path(
+                "scoring.metrics.0.args.pred_path", metric_config.args.pred_path
+            ),
+            ref_path=_compile_path(
+                "scoring.metrics.0.args.ref_path", metric_config.args.ref_path
+            ),
+            strip_punctuation=metric_config.args.normalize.strip_punctuation,
+            primary_metric=spec.scoring.primary_metric,
+            aggregate_name=spec.reporting.aggregate[0].name,
+        )
+
+
+def _compile_path(field: str, path: str) -> CompiledJSONPath:
+    """Compile a spec path once for the whole run, naming the field on failure."""
+    try:
+        return compile_jsonpath(path)
+    except JSONPathError as e:
+        raise ValueError(f"Invalid spec: {field}: {e}") from e
+
+
+class _ResponseCache:
+    """
+    Responses from one system, keyed by request body.
+    
+    Safe to share between worker threads: the first case with a given body
+    sends the request and later cases wait on its in-flight Future instead
+    of sending their own. Only successful responses are kept, so a failed
+    request is retried for the next case with the same input.
+    """
+    
+    def __init__(self) -> None:
+        self._futures: dict[str, Future[Any]] = {}
+        self._lock = threading.Lock()
+    
+    def invoke(
+        self,
+        system: SystemConfig,
+        body: dict[str, Any],
+        client: httpx.Client,
+    ) -> Any:
+        """Invoke the system, or reuse the response to an identical body."""
+        key = json.dumps(body, sort_keys=True)
+        
+        with self._lock:
+            future = self._futures.get(key)
+            if future is None:
+                future = self._futures[key] = Future()
+                owner = True
+            else:
+                owner = False
+        
+        if not owner:
+            return future.result()
+        
+        try:
+            response_json = invoke_case(system, body, client)
+        except BaseException as e:
+            # Cases already waiting share the failure; later ones retry
+            with self._lock:
+                del self._futures[key]
+            future.set_exception(e)
+            raise
+        
+        future.set_result(response_json)
+        return response_json
+
+
 def _run_case(
     case: Case,
     system: SystemConfig,
-    spec: BenchmarkSpec,
+    plan: _RunPlan,
+    client: httpx.Client,
+    response_cache: _ResponseCache | None = None,
 ) -> CaseResult:
     """
     Run a single case against a system.
@@ -34,106 +140,140 @@ def _run_case(
     - extracted_output + metrics (success), or
     - error (failure)
     """
-    # Step 1: Construct request body ($.input in v1-min)
-    body: dict[str, Any] = case.input
-    
-    # Step 2: Invoke HTTP
-    try:
-        response_json = invoke_case(system, body)
-    except InvokeError as e:
-        return CaseResult(
-            case_id=case.id,
-            error=ErrorInfo(
-                code=e.code,
-                message=e.message,
-                http_status=e.http_status,
-            ),
-        )
-    
-    # Step 3: Extract output using output_json_path
-    output_json_path = spec.contract.response.output_json_path
-    try:
-        extracted_output = extract_output(response_json, output_json_path)
-    except ExtractionError as e:
-        return CaseResult(
-            case_id=case.id,
-            error=ErrorInfo(
-                code=e.code,
-                message=e.message,
-            ),
-        )
-    
-    # Step 4: Score with exact_match
-    # Get the metric config (v1-min has exactly one metric: exact_match)
-    metric_config = spec.scoring.metrics[0]
-    pred_path = metric_config.args.pred_path
-    ref_path = metric_config.args.ref_path
-    strip_punctuation = metric_config.args.normalize.strip_punctuation
+    extracted_output = None
     
     try:
+        # Step 1: Construct request body ($.input in v1-min)
+        body: dict[str, Any] = case.input
+        
+        # Step 2: Invoke HTTP
+        if response_cache is None:
+            response_json = invoke_case(system, body, client)
+        else:
+            response_json = response_cache.invoke(system, body, client)
+        
+        # Step 3: Extract output using output_json_path
+        extracted_output = extract_output(response_json, plan.output_json_path)
+        
+        # Step 4: Score with exact_match
         exact_match = score_exact_match(
             extracted_output,
             case.reference,
-            pred_path,
-            ref_path,
-            strip_punctuation,
-        )
-    except MetricError as e:
-        return CaseResult(
-            case_id=case.id,
-            extracted_output=extracted_output,
-            error=ErrorInfo(
-                code=e.code,
-                message=e.message,
-            ),
+            plan.pred_path,
+            plan.ref_path,
+            plan.strip_punctuation,
         )
+    except (InvokeError, ExtractionError, MetricError) as e:
+        # extracted_output is only set if the failure came from scoring
+        return _error_result(case.id, e, extracted_output)
     
     # Success: return extracted output and metrics
     return CaseResult(
         case_id=case.id,
         extracted_output=extracted_output,
-        metrics={metric_config.name: exact_match},
+        metrics={plan.metric_name: exact_match},
     )
 
 
+def _error_result(
+    case_id: str,
+    error: InvokeError | ExtractionError | MetricError,
+    extracted_output: Any = None,
+) -> CaseResult:
+    """Build the CaseResult for a case that failed at any step."""
+    return CaseResult(
+        case_id=case_id,
+        extracted_output=extracted_output,
+        error=ErrorInfo(
+            code=error.code,
+            message=error.message,
+            http_status=getattr(error, "http_status", None),
+        ),
+    )
+
+
+def _map_in_order(
+    executor: ThreadPoolExecutor,
+    fn: Callable[[Case], CaseResult],
+    cases: Iterable[Case],
+    window: int,
+) -> list[CaseResult]:
+    """
+    Apply fn to each case on the executor, returning results in case order.
+    
+    Unlike executor.map, cases are pulled from the iterable only as
+    earlier ones finish, so at most `window` are pending at a time and a
+    lazily loaded dataset is never read ahead of the requests.
+    """
+    results: list[CaseResult] = []
+    pending: deque[Future[CaseResult]] = deque()
+    
+    for case in cases:
+        if len(pending) >= window:
+            results.append(pending.popleft().result())
+        pending.append(executor.submit(fn, case))
+    
+    while pending:
+        results.append(pending.popleft().result())
+    
+    return results
+
+
 def _run_system(
-    cases: list[Case],
+    cases: Iterable[Case],
     system: SystemConfig,
-    spec: BenchmarkSpec,
+    plan: _RunPlan,
+    client: httpx.Client,
+    concurrency: int,
+    dedupe_requests: bool,
 ) -> SystemResult:
     """
     Run all cases against a single system.
     
+    Cases are dispatched on up to `concurrency` worker threads; results
+    are always collected in case order. With dedupe_requests, cases with
+    identical input share one response from this system.
+    
     Returns a SystemResult with aggregated metrics and per-case results.
     """
-    case_results: list[CaseResult] = []
-    error_counter: Counter[str] = Counter()
-    metric_values: list[bool] = []
+    response_cache = _ResponseCache() if dedupe_requests else None
     
-    # Get metric and aggregate config from spec
-    metric_name = spec.scoring.primary_metric
-    aggregate_config = spec.reporting.aggregate[0]
+    def run(case: Case) -> CaseResult:
+        return _run_case(case, system, plan, client, response_cache)
     
-    for case in cases:
-        result = _run_case(case, system, spec)
-        case_results.append(result)
-        
+    if concurrency > 1:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            # Twice the worker count keeps every worker busy while the
+            # oldest pending case is still waiting on its response
+            case_results = _map_in_order(executor, run, cases, 2 * concurrency)
+    else:
+        case_results = [run(case) for case in cases]
+    
+    error_counts: dict[str, int] = {}
+    match_count = 0
+    scored_count = 0
+    
+    metric_name = plan.primary_metric
+    
+    for result in case_results:
         if result.error:
-            error_counter[result.error.code] += 1
+            code = result.error.code
+            error_counts[code] = error_counts.get(code, 0) + 1
         elif result.metrics:
-            # Collect metric values for aggregation
-            metric_values.append(result.metrics[metric_name])
+            # Tally metric values for aggregation
+            match_count += result.metrics[metric_name]
+            scored_count += 1
     
     # Aggregate: compute mean of metric values
-    aggregate_value = aggregate_mean(metric_values)
+    aggregate_value = aggregate_mean_counts(match_count, scored_count)
     
     # Sort error_counts for deterministic output
-    sorted_error_counts = dict(sorted(error_counter.items()))
+    sorted_error_counts = dict(sorted(error_counts.items()))
     
     return SystemResult(
         system_name=system.name,
         primary_metric=metric_name,
-        aggregates={aggregate_config.name: aggregate_value},
+        aggregates={plan.aggregate_name: aggregate_value},
         case_results=case_results,
         error_counts=sorted_error_counts,
     )
@@ -141,31 +281,83 @@ def _run_system(
 
 def run_benchmark(
     spec: BenchmarkSpec,
-    cases: list[Case],
+    cases: Iterable[Case],
     systems: list[SystemConfig],
+    concurrency: int = 1,
+    dedupe_requests: bool = False,
 ) -> RunResult:
     """
     Run a benchmark against one or more systems.
     
     For each system, evaluates all cases and produces aggregated results.
-    A single case failure does not abort the run.
+    A single case failure does not abort the run. When concurrency is
+    greater than 1, systems are also evaluated in parallel.
     
     Args:
         spec: The benchmark specification
-        cases: List of dataset cases to evaluate
+        cases: Dataset cases to evaluate. Any iterable is accepted; with a
+            single system, cases are consumed as the run progresses (e.g.
+            from iter_dataset_jsonl), otherwise they are collected first
         systems: List of systems to test
+        concurrency: Maximum number of in-flight requests per system.
+            The default of 1 sends requests one at a time, in case and
+            system order. Results are reported in input order regardless.
+        dedupe_requests: If True, send each distinct case input to each
+            system once and reuse the response for cases with the same
+            input. Off by default, since systems under test may not answer
+            the same input identically twice.
         
     Returns:
         RunResult with per-system results and per-case breakdown
+        
+    Raises:
+        ValueError: If concurrency is less than 1, or a JSONPath in the
+            spec is invalid (possible only for specs built without
+            validation, e.g. with model_construct)
     """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+    
+    # Read the wall clock once; the run's duration comes from the monotonic
+    # clock so finished_at is never before started_at, even if the system
+    # clock is adjusted mid-run
     started_at = datetime.now(timezone.utc)
+    started_ns = time.monotonic_ns()
     
-    system_results: list[SystemResult] = []
-    for system in systems:
-        result = _run_system(cases, system, spec)
-        system_results.append(result)
+    plan = _RunPlan.from_spec(spec)
+    
+    # Every system needs its own pass over the cases
+    if len(systems) > 1 and not isinstance(cases, list):
+        cases = list(cases)
+    
+    # Systems are independent, so with concurrency enabled they run side by
+    # side, each with its own cap of `concurrency` in-flight requests
+    parallel_systems = concurrency > 1 and len(systems) > 1
+    pool_size = concurrency * len(systems) if parallel_systems else concurrency
+    
+    # One client for the whole run so connections are kept alive between
+    # cases, with a pool sized so every worker can hold a live connection
+    limits = httpx.Limits(
+        max_connections=pool_size,
+        max_keepalive_connections=pool_size,
+    )
+    with httpx.Client(limits=limits) as client:
+        if parallel_systems:
+            with ThreadPoolExecutor(max_workers=len(systems)) as executor:
+                system_results = list(executor.map(
+                    lambda system: _run_system(
+                        cases, system, plan, client, concurrency, dedupe_requests
+                    ),
+                    systems,
+                ))
+        else:
+            system_results = [
+                _run_system(cases, system, plan, client, concurrency, dedupe_requests)
+                for system in systems
+            ]
     
-    finished_at = datetime.now(timezone.utc)
+    elapsed = timedelta(microseconds=(time.monotonic_ns() - started_ns) // 1000)
+    finished_at = started_at + elapsed
     
     return RunResult(
         benchmark_id=spec.id,
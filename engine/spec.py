@@ -5,11 +5,14 @@ This module defines Pydantic models for the v1-min benchmark specification
 and provides functions to load and validate specs from YAML/JSON files.
 """
 
+import json
 from pathlib import Path
 from typing import Literal
 
 import yaml
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from engine.jsonpath import JSONPathError, compile_jsonpath
 
 __all__ = [
     # Models
@@ -49,6 +52,15 @@ class RequestConfig(BaseModel):
     )
 
 
+def _check_jsonpath(value: str) -> str:
+    """Reject paths compile_jsonpath cannot parse, rather than failing every case at run time."""
+    try:
+        compile_jsonpath(value)
+    except JSONPathError as e:
+        raise ValueError(str(e)) from e
+    return value
+
+
 class ResponseConfig(BaseModel):
     """HTTP response configuration."""
     
@@ -56,6 +68,12 @@ class ResponseConfig(BaseModel):
         ..., 
         description="JSONPath to extract output from response (use $ for full response)"
     )
+    
+    @field_validator("output_json_path")
+    @classmethod
+    def validate_output_json_path(cls, value: str) -> str:
+        """Ensure the path is supported JSONPath syntax."""
+        return _check_jsonpath(value)
 
 
 class ContractConfig(BaseModel):
@@ -80,6 +98,12 @@ class MetricArgs(BaseModel):
     pred_path: str = Field(..., description="JSONPath into extracted output")
     ref_path: str = Field(..., description="JSONPath into case.reference")
     normalize: NormalizeConfig
+    
+    @field_validator("pred_path", "ref_path")
+    @classmethod
+    def validate_paths(cls, value: str) -> str:
+        """Ensure both paths are supported JSONPath syntax."""
+        return _check_jsonpath(value)
 
 
 class MetricConfig(BaseModel):
@@ -169,6 +193,13 @@ class SpecLoadError(Exception):
     pass
 
 
+# Use libyaml's C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
 def load_spec(path: str | Path) -> BenchmarkSpec:
     """
     Load and validate a benchmark spec from a YAML or JSON file.
@@ -192,10 +223,14 @@ def load_spec(path: str | Path) -> BenchmarkSpec:
     except Exception as e:
         raise SpecLoadError(f"Failed to read spec file: {e}") from e
     
-    # Parse YAML (also handles JSON since JSON is valid YAML)
+    # Parse .json specs with the json module; everything else as YAML
+    # (which also handles JSON since JSON is valid YAML)
     try:
-        data = yaml.safe_load(content)
-    except yaml.YAMLError as e:
+        if path.suffix.lower() == ".json":
+            data = json.loads(content) if content.strip() else None
+        else:
+            data = yaml.load(content, Loader=_YamlLoader)
+    except (json.JSONDecodeError, yaml.YAMLError) as e:
         raise SpecLoadError(f"Failed to parse spec file: {e}") from e
     
     if data is None:
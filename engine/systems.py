@@ -5,6 +5,9 @@ This module provides the SystemConfig model and functions to invoke
 systems under test via HTTP.
 """
 
+import atexit
+import json
+import threading
 from typing import Any
 
 import httpx
@@ -13,6 +16,7 @@ from pydantic import BaseModel, Field
 __all__ = [
     "SystemConfig",
     "invoke_case",
+    "close_shared_client",
     "InvokeError",
 ]
 
@@ -49,8 +53,41 @@ class InvokeError(Exception):
 # Default timeout in seconds
 _DEFAULT_TIMEOUT = 30.0
 
+# Client used when invoke_case is called without one, created on first use
+_shared_client: httpx.Client | None = None
+_shared_client_lock = threading.Lock()
 
-def invoke_case(system: SystemConfig, body: dict[str, Any]) -> Any:
+
+def _get_shared_client() -> httpx.Client:
+    """Return the module-level client, creating it on first use."""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = httpx.Client()
+        return _shared_client
+
+
+@atexit.register
+def close_shared_client() -> None:
+    """
+    Close the module-level client used by invoke_case when no client is given.
+    
+    Called automatically at interpreter exit. A new client is created if
+    invoke_case is called again afterwards.
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is not None:
+            _shared_client.close()
+            _shared_client = None
+
+
+def invoke_case(
+    system: SystemConfig,
+    body: dict[str, Any],
+    client: httpx.Client | None = None,
+    timeout: float = _DEFAULT_TIMEOUT,
+) -> Any:
     """
     Invoke a system with a case input and return the parsed JSON response.
     
@@ -60,6 +97,9 @@ def invoke_case(system: SystemConfig, body: dict[str, Any]) -> Any:
     Args:
         system: The system configuration (name and endpoint)
         body: The JSON body to send (typically case.input)
+        client: Optional client whose connection pool is reused across
+            calls (keep-alive). A module-level client is used if omitted.
+        timeout: Request timeout in seconds
         
     Returns:
         Parsed JSON response from the system
@@ -70,16 +110,19 @@ def invoke_case(system: SystemConfig, body: dict[str, Any]) -> Any:
             - 'http_error': Non-2xx status code (includes http_status)
             - 'invalid_json': Response is not valid JSON
     """
+    if client is None:
+        client = _get_shared_client()
+    
     try:
-        response = httpx.post(
+        response = client.post(
             system.endpoint,
             json=body,
-            timeout=_DEFAULT_TIMEOUT,
+            timeout=timeout,
         )
     except httpx.TimeoutException as e:
         raise InvokeError(
             code="timeout",
-            message=f"Request to {system.endpoint} timed out after {_DEFAULT_TIMEOUT}s",
+            message=f"Request to {system.endpoint} timed out after {timeout}s",
         ) from e
     except httpx.RequestError as e:
         raise InvokeError(
@@ -88,17 +131,19 @@ def invoke_case(system: SystemConfig, body: dict[str, Any]) -> Any:
         ) from e
     
     # Check for non-2xx status
-    if not response.is_success:
+    status_code = response.status_code
+    if not 200 <= status_code < 300:
         raise InvokeError(
             code="http_error",
-            message=f"Request to {system.endpoint} returned status {response.status_code}",
-            http_status=response.status_code,
+            message=f"Request to {system.endpoint} returned status {status_code}",
+            http_status=status_code,
         )
     
-    # Parse JSON response
+    # Parse JSON response straight from the raw bytes (ValueError also
+    # covers invalid UTF-8; RecursionError comes from very deep nesting)
     try:
-        return response.json()
-    except Exception as e:
+        return json.loads(response.content)
+    except (ValueError, RecursionError) as e:
         raise InvokeError(
             code="invalid_json",
             message=f"Response from {system.endpoint} is not valid JSON: {e}",
@@ -11,13 +11,19 @@ Docs: https://ai.google.dev/gemini-api/docs/quickstart
 """
 
 import os
-import httpx
+from functools import lru_cache
+
+from proxies.proxies.upstream import make_upstream_client
 
 API_URL = "https://generativelanguage.googleapis.com/v1beta/models"
 
+# Shared across requests so upstream connections are kept alive
+_client = make_upstream_client()
+
 
+@lru_cache(maxsize=1)
 def get_api_key() -> str:
-    """Get API key from environment."""
+    """Get API key from environment (read once; the key is fixed for the process)."""
     key = os.environ.get("GOOGLE_API_KEY") or os.environ.get("GEMINI_API_KEY")
     if not key:
         raise ValueError("GOOGLE_API_KEY not set in .env (get free key at https://aistudio.google.com/apikey)")
@@ -42,14 +48,13 @@ def call(model: str, prompt: str, system_prompt: str) -> str:
             "generationConfig": {"maxOutputTokens": 100, "temperature": 0},
         }
     
-    response = httpx.post(
+    response = _client.post(
         f"{API_URL}/{model}:generateContent",
         headers={
             "x-goog-api-key": get_api_key(),
             "Content-Type": "application/json",
         },
         json=payload,
-        timeout=60.0,
     )
     
     if response.status_code != 200:
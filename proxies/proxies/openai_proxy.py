@@ -1,13 +1,19 @@
 """OpenAI proxy for proxy_runner."""
 
 import os
-import httpx
+from functools import lru_cache
+
+from proxies.proxies.upstream import make_upstream_client
 
 API_URL = "https://api.openai.com/v1/chat/completions"
 
+# Shared across requests so upstream connections are kept alive
+_client = make_upstream_client()
+
 
+@lru_cache(maxsize=1)
 def get_api_key() -> str:
-    """Get API key from environment."""
+    """Get API key from environment (read once; the key is fixed for the process)."""
     key = os.environ.get("OPENAI_API_KEY")
     if not key:
         raise ValueError("OPENAI_API_KEY not set in .env")
@@ -16,7 +22,7 @@ def get_api_key() -> str:
 
 def call(model: str, prompt: str, system_prompt: str) -> str:
     """Call OpenAI API and return the response text."""
-    response = httpx.post(
+    response = _client.post(
         API_URL,
         headers={"Authorization": f"Bearer {get_api_key()}"},
         json={
@@ -28,7 +34,6 @@ def call(model: str, prompt: str, system_prompt: str) -> str:
             "max_tokens": 100,
             "temperature": 0,
         },
-        timeout=60.0,
     )
     
     if response.status_code != 200:
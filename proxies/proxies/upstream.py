@@ -0,0 +1,32 @@
+"""Shared upstream HTTP client setup for the provider proxies."""
+
+import atexit
+import importlib.util
+
+import httpx
+
+# httpx needs h2 for HTTP/2; without it, fall back to HTTP/1.1
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Maximum upstream calls in flight per provider, across all of its models
+# (proxy_runner makes extra requests wait their turn instead of tripping
+# provider rate limits)
+MAX_CONCURRENT_CALLS = 8
+
+
+def make_upstream_client() -> httpx.Client:
+    """Create a provider's shared client, closed when the process exits."""
+    # Shared across requests so upstream TLS connections are kept alive; the
+    # pool holds one connection per call the provider may have in flight, and
+    # with HTTP/2 concurrent calls share a connection
+    client = httpx.Client(
+        http2=_HTTP2,
+        limits=httpx.Limits(
+            max_connections=MAX_CONCURRENT_CALLS,
+            max_keepalive_connections=MAX_CONCURRENT_CALLS,
+            keepalive_expiry=30.0,
+        ),
+        timeout=httpx.Timeout(60.0, connect=5.0),
+    )
+    atexit.register(client.close)
+    return client
@@ -10,14 +10,25 @@ Edit the MODELS configuration below to add/remove models.
 
 import json
 import os
+import re
 import sys
 import threading
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from pathlib import Path
 
+# Request bodies are parsed with the stdlib json module, which reads the
+# NaN/Infinity and wide integers the engine can send; orjson, when
+# installed, only encodes responses
+try:
+    from orjson import dumps as _json_dumps
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 # Import proxies (add parent to path for direct script execution)
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from proxies.proxies import openai_proxy, groq_proxy, google_proxy
+from proxies.proxies.upstream import MAX_CONCURRENT_CALLS
 
 
 # === CONFIGURATION ===
@@ -37,6 +48,9 @@ MODELS = [
 # System prompt file (shared across all providers)
 SYSTEM_PROMPT_FILE = Path(__file__).parent / "system_prompt.txt"
 
+# The cap on upstream calls in flight per provider is MAX_CONCURRENT_CALLS
+# in proxies/proxies/upstream.py, which also sizes each provider's connection pool
+
 
 # === IMPLEMENTATION ===
 
@@ -47,14 +61,21 @@ PROXIES = {
     "google": google_proxy,
 }
 
+# KEY=value lines in a .env file (an optional "export " prefix is allowed;
+# comments and blank lines never match)
+_ENV_LINE = re.compile(r"^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t]*\r?$", re.M)
+
+
+def load_env_file(path: Path):
+    """Set environment variables from a .env file, without overriding existing ones."""
+    for key, value in _ENV_LINE.findall(path.read_text()):
+        os.environ.setdefault(key, value)
+
+
 # Load .env file
 env_file = Path(__file__).parent.parent / ".env"
 if env_file.exists():
-    for line in env_file.read_text().splitlines():
-        line = line.strip()
-        if line and not line.startswith("#") and "=" in line:
-            key, value = line.split("=", 1)
-            os.environ.setdefault(key.strip(), value.strip())
+    load_env_file(env_file)
 
 # Load system prompt
 if SYSTEM_PROMPT_FILE.exists():
@@ -64,50 +85,80 @@ else:
     print(f"Warning: {SYSTEM_PROMPT_FILE} not found, using default prompt")
 
 
+# One slot per allowed in-flight call, per provider
+_call_slots = {
+    provider: threading.BoundedSemaphore(MAX_CONCURRENT_CALLS)
+    for provider in PROXIES
+}
+
+
 def call_llm(provider: str, model: str, prompt: str) -> str:
     """Call an LLM provider and return the response text."""
     proxy_module = PROXIES[provider]
-    return proxy_module.call(model, prompt, SYSTEM_PROMPT)
-
-
-def make_handler(provider: str, model: str):
-    """Create a handler class for a specific provider/model."""
-    class Handler(BaseHTTPRequestHandler):
-        def do_POST(self):
-            if self.path != "/solve":
-                self.send_error(404)
-                return
-
-            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
-            data = json.loads(body)
-            prompt = data.get("question") or data.get("prompt", "")
-
-            try:
-                answer = call_llm(provider, model, prompt)
-                self.send_response(200)
-                self.send_header("Content-Type", "application/json")
-                self.end_headers()
-                self.wfile.write(json.dumps({"answer": answer}).encode())
-            except Exception as e:
-                # Sanitize error message - newlines break HTTP headers
-                error_msg = str(e).replace("\n", " ").replace("\r", " ")[:200]
-                print(f"[{provider}/{model}] Error: {e}")
-                self.send_response(500)
-                self.send_header("Content-Type", "application/json")
-                self.end_headers()
-                self.wfile.write(json.dumps({"error": error_msg}).encode())
-
-        def log_message(self, fmt, *args):
-            print(f"[{provider}/{model}] {args[0]}")
-
-    return Handler
+    with _call_slots[provider]:
+        return proxy_module.call(model, prompt, SYSTEM_PROMPT)
+
+
+# Translation table for flattening error messages onto one line
+_NEWLINES_TO_SPACES = str.maketrans("\r\n", "  ")
+
+
+class SolveHandler(BaseHTTPRequestHandler):
+    """Serve /solve for the provider/model of the ProxyServer it runs under."""
+
+    # HTTP/1.1 lets the engine's client keep connections alive between cases
+    protocol_version = "HTTP/1.1"
+    # Buffer writes so headers and body leave in one send; the base class
+    # flushes after each request
+    wbufsize = -1
+    # Without TCP_NODELAY, Nagle + delayed ACK can stall a keep-alive
+    # response by ~40ms
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        if self.path != "/solve":
+            self.send_error(404)
+            return
+
+        provider, model = self.server.provider, self.server.model
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        data = json.loads(body)
+        prompt = data.get("question") or data.get("prompt", "")
+
+        try:
+            answer = call_llm(provider, model, prompt)
+            self.send_json(200, {"answer": answer})
+        except Exception as e:
+            # Sanitize error message - newlines break HTTP headers
+            error_msg = str(e).translate(_NEWLINES_TO_SPACES)[:200]
+            print(f"[{provider}/{model}] Error: {e}")
+            self.send_json(500, {"error": error_msg})
+
+    def send_json(self, status: int, payload: dict):
+        """Send a JSON response with an explicit Content-Length."""
+        encoded = _json_dumps(payload)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def log_message(self, fmt, *args):
+        print(f"[{self.server.provider}/{self.server.model}] {args[0]}")
+
+
+class ProxyServer(ThreadingHTTPServer):
+    """A threaded server for one provider/model, handling each connection on its own thread."""
+
+    def __init__(self, port: int, provider: str, model: str):
+        self.provider = provider
+        self.model = model
+        super().__init__(("localhost", port), SolveHandler)
 
 
 def run_server(provider: str, model: str, port: int):
     """Run a server for a single model."""
-    handler = make_handler(provider, model)
-    server = HTTPServer(("localhost", port), handler)
-    server.serve_forever()
+    ProxyServer(port, provider, model).serve_forever()
 
 
 def check_api_keys():
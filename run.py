@@ -21,6 +21,11 @@ SYSTEMS = [
     SystemConfig(name="google-gemma-3-1b", endpoint="http://localhost:8003/solve"),
 ]
 
+# Maximum in-flight requests per system (1 = sequential). Raising it also
+# runs the systems in parallel; keep it within each provider's rate limit
+# (e.g. 30 RPM for free-tier Gemma), since 429s are scored as http_error
+CONCURRENCY = 1
+
 # Output file (optional)
 OUTPUT_FILE = "results.json"
 
@@ -40,7 +45,7 @@ def main():
     print()
     
     # Run
-    result = run_benchmark(spec, cases, SYSTEMS)
+    result = run_benchmark(spec, cases, SYSTEMS, concurrency=CONCURRENCY)
     
     # Print results
     for sys_result in result.systems:
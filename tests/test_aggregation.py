@@ -2,7 +2,7 @@
 
 import pytest
 
-from engine.aggregation import aggregate_mean
+from engine.aggregation import aggregate_mean, aggregate_mean_counts
 
 
 class TestAggregateMean:
@@ -80,3 +80,20 @@ class TestAggregateMean:
         assert isinstance(aggregate_mean([]), float)
         assert isinstance(aggregate_mean([True, False]), float)
 
+
+class TestAggregateMeanCounts:
+    """Tests for aggregate_mean_counts function."""
+    
+    def test_counts(self):
+        """Counts produce the same mean as the equivalent list."""
+        assert aggregate_mean_counts(2, 4) == 0.5
+        assert aggregate_mean_counts(1, 10) == aggregate_mean([True] + [False] * 9)
+    
+    def test_zero_total_returns_zero(self):
+        """Zero total returns 0.0 (no valid cases)."""
+        assert aggregate_mean_counts(0, 0) == 0.0
+    
+    def test_returns_float(self):
+        """Always returns a float."""
+        assert isinstance(aggregate_mean_counts(1, 1), float)
+        assert isinstance(aggregate_mean_counts(0, 0), float)
@@ -1,9 +1,10 @@
 """Tests for dataset loading and validation."""
 
+import json
 import pytest
 from pathlib import Path
 
-from engine.dataset import load_dataset_jsonl, Case, DatasetLoadError
+from engine.dataset import iter_dataset_jsonl, load_dataset_jsonl, Case, DatasetLoadError
 
 
 # Path to fixture dataset
@@ -34,6 +35,12 @@ class TestCase:
         with pytest.raises(ValueError, match="reference must be a non-empty"):
             Case(id="test", input={"q": "?"}, reference={})
     
+    def test_case_is_frozen(self):
+        """Cases cannot be reassigned after creation."""
+        case = Case(id="test", input={"q": "?"}, reference={"a": "!"})
+        with pytest.raises(ValueError):
+            case.id = "other"
+    
     def test_empty_id_rejected(self):
         """Reject case with empty id string."""
         with pytest.raises(ValueError):
@@ -129,6 +136,17 @@ class TestLoadDatasetJsonl:
         with pytest.raises(DatasetLoadError, match="must be a JSON object"):
             load_dataset_jsonl(bad_file)
     
+    def test_scalar_line(self, tmp_path):
+        """Raise DatasetLoadError for a scalar JSON line, with its line number."""
+        bad_file = tmp_path / "scalar.jsonl"
+        bad_file.write_text(
+            '{"id": "1", "input": {"q": "a"}, "reference": {"a": "a"}}\n'
+            '"just a string"\n'
+        )
+        
+        with pytest.raises(DatasetLoadError, match="Line 2: Each line must be a JSON object"):
+            load_dataset_jsonl(bad_file)
+    
     def test_skips_empty_lines(self, tmp_path):
         """Empty lines are skipped."""
         sparse_file = tmp_path / "sparse.jsonl"
@@ -143,6 +161,33 @@ class TestLoadDatasetJsonl:
         assert cases[0].id == "1"
         assert cases[1].id == "2"
     
+    def test_whitespace_only_file(self, tmp_path):
+        """Raise DatasetLoadError for a file with only blank lines."""
+        blank_file = tmp_path / "blank.jsonl"
+        blank_file.write_text("\n  \n\n")
+        
+        with pytest.raises(DatasetLoadError, match="empty"):
+            load_dataset_jsonl(blank_file)
+    
+    def test_line_numbers_include_blank_lines(self, tmp_path):
+        """Reported line numbers match the physical line in the file."""
+        bad_file = tmp_path / "leading_blank.jsonl"
+        bad_file.write_text('\n\n{"id": "test", invalid}\n')
+        
+        with pytest.raises(DatasetLoadError, match="Invalid JSON on line 3"):
+            load_dataset_jsonl(bad_file)
+    
+    def test_crlf_line_endings(self, tmp_path):
+        """Windows line endings are handled."""
+        crlf_file = tmp_path / "crlf.jsonl"
+        crlf_file.write_bytes(
+            b'{"id": "1", "input": {"q": "a"}, "reference": {"a": "a"}}\r\n'
+            b'{"id": "2", "input": {"q": "b"}, "reference": {"a": "b"}}\r\n'
+        )
+        
+        cases = load_dataset_jsonl(crlf_file)
+        assert [c.id for c in cases] == ["1", "2"]
+    
     def test_input_must_be_object(self, tmp_path):
         """Raise error if input is not an object."""
         bad_file = tmp_path / "string_input.jsonl"
@@ -158,4 +203,56 @@ class TestLoadDatasetJsonl:
         
         with pytest.raises(DatasetLoadError, match="Invalid case"):
             load_dataset_jsonl(bad_file)
+    
+    def test_values_match_stdlib_json(self, tmp_path):
+        """Lines load exactly as json.loads parses them, BOM included."""
+        lines = [
+            '\ufeff{"id": "bom", "input": {"q": "a"}, "reference": {"answer": "a"}}',
+            '{"id": "big", "input": {"q": "b"}, "reference": {"answer": 123456789012345678901234567890}}',
+            '{"id": "neg", "input": {"q": "c"}, "reference": {"answer": -9223372036854775809}}',
+            '{"id": "inf", "input": {"q": "d"}, "reference": {"answer": Infinity}}',
+        ]
+        data_file = tmp_path / "parity.jsonl"
+        data_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        
+        cases = load_dataset_jsonl(data_file)
+        
+        expected = [json.loads(line.encode("utf-8"))["reference"] for line in lines]
+        assert [c.reference for c in cases] == expected
+        assert cases[1].reference["answer"] == 123456789012345678901234567890
+
 
+class TestIterDatasetJsonl:
+    """Tests for iter_dataset_jsonl function."""
+    
+    def test_yields_cases_lazily(self, tmp_path):
+        """Valid lines are yielded before a later invalid line is reached."""
+        partial_file = tmp_path / "partial.jsonl"
+        partial_file.write_text(
+            '{"id": "1", "input": {"q": "a"}, "reference": {"a": "a"}}\n'
+            'not json\n'
+        )
+        
+        cases = iter_dataset_jsonl(partial_file)
+        assert next(cases).id == "1"
+        with pytest.raises(DatasetLoadError, match="Invalid JSON on line 2"):
+            next(cases)
+    
+    def test_duplicate_ids(self, tmp_path):
+        """Duplicate IDs are rejected during iteration."""
+        dup_file = tmp_path / "dup.jsonl"
+        dup_file.write_text(
+            '{"id": "same", "input": {"q": "a"}, "reference": {"a": "a"}}\n'
+            '{"id": "same", "input": {"q": "b"}, "reference": {"a": "b"}}\n'
+        )
+        
+        with pytest.raises(DatasetLoadError, match="Duplicate case ID 'same'"):
+            list(iter_dataset_jsonl(dup_file))
+    
+    def test_empty_file(self, tmp_path):
+        """An empty file is rejected once iteration finishes."""
+        empty_file = tmp_path / "empty.jsonl"
+        empty_file.write_text("")
+        
+        with pytest.raises(DatasetLoadError, match="empty"):
+            list(iter_dataset_jsonl(empty_file))
@@ -11,9 +11,9 @@ from engine.spec import load_spec
 from engine.systems import SystemConfig
 
 
-@pytest.fixture
-def benchmark_spec(tmp_path):
-    """Create a benchmark spec."""
+@pytest.fixture(scope="module")
+def benchmark_spec(tmp_path_factory):
+    """Create a benchmark spec (loaded once per module)."""
     spec_content = """
 id: determinism_test
 name: Determinism Test
@@ -48,7 +48,7 @@ reporting:
       type: mean
       metric: exact_match
 """
-    spec_file = tmp_path / "benchmark.yaml"
+    spec_file = tmp_path_factory.mktemp("spec") / "benchmark.yaml"
     spec_file.write_text(spec_content)
     return load_spec(spec_file)
 
@@ -3,6 +3,7 @@
 import pytest
 
 from engine.extraction import extract_output, ExtractionError
+from engine.jsonpath import compile_jsonpath
 
 
 class TestExtractOutput:
@@ -128,6 +129,21 @@ class TestExtractOutput:
             assert "b" in e.message
             assert "not found" in e.message
     
+    # --- Precompiled paths ---
+    
+    def test_compiled_path(self):
+        """A precompiled path extracts the same value as its string form."""
+        response = {"result": {"answer": "42"}}
+        assert extract_output(response, compile_jsonpath("$.result.answer")) == "42"
+    
+    def test_compiled_path_error_reports_path(self):
+        """Errors from a precompiled path carry the original path string."""
+        with pytest.raises(ExtractionError) as exc_info:
+            extract_output({"a": 1}, compile_jsonpath("$.b"))
+        
+        assert exc_info.value.code == "output_extraction_failed"
+        assert exc_info.value.path == "$.b"
+    
     # --- Integration with typical response structures ---
     
     def test_openai_style_response(self):
@@ -20,8 +20,8 @@ def test_import_spec_module():
 def test_top_level_exports():
     """Verify public API is exported from top-level package."""
     from engine import load_spec, BenchmarkSpec, SpecLoadError
-    from engine import load_dataset_jsonl, Case, DatasetLoadError
-    from engine import eval_jsonpath, JSONPathError
+    from engine import load_dataset_jsonl, iter_dataset_jsonl, Case, DatasetLoadError
+    from engine import eval_jsonpath, compile_jsonpath, JSONPathError
     from engine import extract_output, ExtractionError
     from engine import score_exact_match, MetricError
     from engine import aggregate_mean
@@ -34,11 +34,13 @@ def test_top_level_exports():
     
     # Dataset
     assert callable(load_dataset_jsonl)
+    assert callable(iter_dataset_jsonl)
     assert Case is not None
     assert issubclass(DatasetLoadError, Exception)
     
     # JSONPath
     assert callable(eval_jsonpath)
+    assert callable(compile_jsonpath)
     assert issubclass(JSONPathError, Exception)
     
     # Extraction
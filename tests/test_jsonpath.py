@@ -2,7 +2,7 @@
 
 import pytest
 
-from engine.jsonpath import eval_jsonpath, JSONPathError
+from engine.jsonpath import _parse_path, compile_jsonpath, eval_jsonpath, JSONPathError
 
 
 class TestEvalJsonpath:
@@ -141,6 +141,25 @@ class TestEvalJsonpath:
         with pytest.raises(JSONPathError, match="null value"):
             eval_jsonpath(obj, "$.value.nested")
     
+    def test_error_reports_traversed_path(self):
+        """Error message includes the path up to the failing field."""
+        obj = {"a": {"b": 1}}
+        with pytest.raises(JSONPathError, match=r"at path: \$\.a\.c$"):
+            eval_jsonpath(obj, "$.a.c.d")
+    
+    def test_repeated_path_parsed_once(self):
+        """Reusing a path string hits the parse cache."""
+        eval_jsonpath({"cached": 1}, "$.cached")
+        hits = _parse_path.cache_info().hits
+        assert eval_jsonpath({"cached": 2}, "$.cached") == 2
+        assert _parse_path.cache_info().hits == hits + 1
+    
+    def test_repeated_invalid_path_still_raises(self):
+        """Invalid paths raise on every call, not just the first."""
+        for _ in range(2):
+            with pytest.raises(JSONPathError, match="Invalid JSONPath syntax"):
+                eval_jsonpath({}, "$.items[0]")
+    
     # --- Integration with Case structure ---
     
     def test_case_input_extraction(self):
@@ -153,3 +172,35 @@ class TestEvalJsonpath:
         assert eval_jsonpath(case, "$.input") == {"question": "What is 2+2?"}
         assert eval_jsonpath(case, "$.reference.answer") == "4"
 
+
+
+class TestCompileJsonpath:
+    """Tests for compile_jsonpath function."""
+    
+    def test_root(self):
+        """Compiled $ returns the object itself."""
+        evaluate = compile_jsonpath("$")
+        assert evaluate({"a": 1}) == {"a": 1}
+        assert evaluate("hello") == "hello"
+    
+    def test_nested_fields(self):
+        """Compiled path can be applied to many objects."""
+        evaluate = compile_jsonpath("$.a.b")
+        assert evaluate({"a": {"b": 1}}) == 1
+        assert evaluate({"a": {"b": "two"}}) == "two"
+    
+    def test_invalid_path_rejected_at_compile_time(self):
+        """Invalid syntax raises when compiling, before any evaluation."""
+        with pytest.raises(JSONPathError, match="Invalid JSONPath syntax"):
+            compile_jsonpath("$.items[0]")
+    
+    def test_non_string_path_rejected(self):
+        """Non-string path raises error."""
+        with pytest.raises(JSONPathError, match="must be a string"):
+            compile_jsonpath(123)
+    
+    def test_resolution_error_raised_on_evaluation(self):
+        """Missing fields raise when the compiled path is evaluated."""
+        evaluate = compile_jsonpath("$.a.c")
+        with pytest.raises(JSONPathError, match="Field 'c' not found"):
+            evaluate({"a": {"b": 1}})
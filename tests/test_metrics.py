@@ -2,6 +2,7 @@
 
 import pytest
 
+from engine.jsonpath import compile_jsonpath
 from engine.metrics import score_exact_match, MetricError
 
 
@@ -194,6 +195,22 @@ class TestScoreExactMatch:
             strip_punctuation=True
         ) is True
     
+    # --- Precompiled paths ---
+    
+    def test_compiled_paths(self):
+        """Precompiled paths score the same as their string forms."""
+        assert score_exact_match(
+            {"result": " Four "}, {"answer": "four"},
+            compile_jsonpath("$.result"), compile_jsonpath("$.answer"),
+        ) is True
+    
+    def test_compiled_path_error_message(self):
+        """Errors from a precompiled path mention the original path."""
+        with pytest.raises(MetricError) as exc_info:
+            score_exact_match({"a": 1}, {"answer": "1"}, compile_jsonpath("$.missing"), "$.answer")
+        
+        assert "$.missing" in exc_info.value.message
+    
     # --- Integration with benchmark case structure ---
     
     def test_typical_qa_case(self):
@@ -1,5 +1,7 @@
 """Tests for benchmark runner orchestration."""
 
+import json
+import time
 from datetime import datetime, timezone
 
 import httpx
@@ -16,9 +18,9 @@ from engine.systems import SystemConfig
 # --- Fixtures ---
 
 
-@pytest.fixture
-def simple_spec(tmp_path):
-    """Create a simple benchmark spec for testing."""
+@pytest.fixture(scope="module")
+def simple_spec(tmp_path_factory):
+    """Create a simple benchmark spec for testing (loaded once; copy before modifying)."""
     spec_content = """
 id: test_benchmark
 name: Test Benchmark
@@ -53,7 +55,7 @@ reporting:
       type: mean
       metric: exact_match
 """
-    spec_file = tmp_path / "benchmark.yaml"
+    spec_file = tmp_path_factory.mktemp("spec") / "benchmark.yaml"
     spec_file.write_text(spec_content)
     return load_spec(spec_file)
 
@@ -247,6 +249,16 @@ class TestRunBenchmark:
         }
         assert sys_result.aggregates["exact_match_rate"] == 1.0  # 1/1 successful
     
+    def test_invalid_path_rejected_before_run(self, httpx_mock: HTTPXMock, simple_spec, simple_cases, system):
+        """An invalid path in an unvalidated spec raises ValueError naming the field."""
+        spec = simple_spec.model_copy(deep=True)
+        spec.contract.response.output_json_path = "$.items[0]"
+        
+        with pytest.raises(ValueError, match=r"contract\.response\.output_json_path"):
+            run_benchmark(spec, simple_cases, [system])
+        
+        assert httpx_mock.get_requests() == []
+    
     # --- Result structure ---
     
     def test_result_has_timestamps(self, httpx_mock: HTTPXMock, simple_spec, simple_cases, system):
@@ -328,6 +340,158 @@ class TestRunBenchmark:
         assert len(sys_result.case_results) == 1
 
 
+class TestConcurrency:
+    """Tests for concurrent case dispatch."""
+    
+    @staticmethod
+    def _echo_answer(request: httpx.Request) -> httpx.Response:
+        """Answer each question correctly based on the request body."""
+        answers = {"1+1": "2", "2+2": "4", "3+3": "6"}
+        question = json.loads(request.content)["question"]
+        return httpx.Response(200, json={"answer": answers[question]})
+    
+    def test_concurrent_run_matches_sequential(
+        self, httpx_mock: HTTPXMock, simple_spec, simple_cases, system
+    ):
+        """Concurrent dispatch produces the same results as sequential."""
+        httpx_mock.add_callback(self._echo_answer, is_reusable=True)
+        
+        sequential = run_benchmark(simple_spec, simple_cases, [system])
+        concurrent = run_benchmark(simple_spec, simple_cases, [system], concurrency=3)
+        
+        assert concurrent.systems == sequential.systems
+        assert concurrent.systems[0].aggregates["exact_match_rate"] == 1.0
+    
+    def test_concurrent_run_preserves_case_order(
+        self, httpx_mock: HTTPXMock, simple_spec, simple_cases, system
+    ):
+        """Case results stay in input order under concurrency."""
+        httpx_mock.add_callback(self._echo_answer, is_reusable=True)
+        
+        result = run_benchmark(simple_spec, simple_cases, [system], concurrency=8)
+        
+        case_ids = [cr.case_id for cr in result.systems[0].case_results]
+        assert case_ids == ["case_1", "case_2", "case_3"]
+    
+    def test_concurrent_multiple_systems(
+        self, httpx_mock: HTTPXMock, simple_spec, simple_cases
+    ):
+        """Systems run in parallel keep their order and their own responses."""
+        good = SystemConfig(name="good_system", endpoint="http://good.local/solve")
+        bad = SystemConfig(name="bad_system", endpoint="http://bad.local/solve")
+        httpx_mock.add_callback(self._echo_answer, url="http://good.local/solve", is_reusable=True)
+        httpx_mock.add_response(json={"answer": "x"}, url="http://bad.local/solve", is_reusable=True)
+        
+        result = run_benchmark(simple_spec, simple_cases, [good, bad], concurrency=2)
+        
+        assert [sr.system_name for sr in result.systems] == ["good_system", "bad_system"]
+        assert result.systems[0].aggregates["exact_match_rate"] == 1.0
+        assert result.systems[1].aggregates["exact_match_rate"] == 0.0
+    
+    def test_cases_from_iterator(
+        self, httpx_mock: HTTPXMock, simple_spec, simple_cases, system
+    ):
+        """Cases can be streamed from an iterator instead of a list."""
+        httpx_mock.add_callback(self._echo_answer, is_reusable=True)
+        
+        result = run_benchmark(simple_spec, iter(simple_cases), [system], concurrency=2)
+        
+        case_ids = [cr.case_id for cr in result.systems[0].case_results]
+        assert case_ids == ["case_1", "case_2", "case_3"]
+        assert result.systems[0].aggregates["exact_match_rate"] == 1.0
+    
+    def test_iterator_shared_by_multiple_systems(
+        self, httpx_mock: HTTPXMock, simple_spec, simple_cases
+    ):
+        """Every system sees every case when cases come from an iterator."""
+        systems = [
+            SystemConfig(name="system_a", endpoint="http://a.local/solve"),
+            SystemConfig(name="system_b", endpoint="http://b.local/solve"),
+        ]
+        httpx_mock.add_callback(self._echo_answer, is_reusable=True)
+        
+        result = run_benchmark(simple_spec, iter(simple_cases), systems)
+        
+        assert [len(sr.case_results) for sr in result.systems] == [3, 3]
+    
+    def test_invalid_concurrency_rejected(self, simple_spec, simple_cases, system):
+        """Concurrency below 1 is rejected."""
+        with pytest.raises(ValueError, match="concurrency"):
+            run_benchmark(simple_spec, simple_cases, [system], concurrency=0)
+
+
+class TestDedupeRequests:
+    """Tests for reusing responses across cases with identical input."""
+    
+    @pytest.fixture
+    def repeated_cases(self):
+        """Cases where two share the same input."""
+        return [
+            Case(id="case_1", input={"question": "1+1"}, reference={"answer": "2"}),
+            Case(id="case_2", input={"question": "1+1"}, reference={"answer": "2"}),
+            Case(id="case_3", input={"question": "2+2"}, reference={"answer": "4"}),
+        ]
+    
+    def test_identical_inputs_sent_once(
+        self, httpx_mock: HTTPXMock, simple_spec, repeated_cases, system
+    ):
+        """Each distinct input is sent once per system when enabled."""
+        httpx_mock.add_callback(TestConcurrency._echo_answer, is_reusable=True)
+        
+        result = run_benchmark(simple_spec, repeated_cases, [system], dedupe_requests=True)
+        
+        assert len(httpx_mock.get_requests()) == 2
+        assert [cr.case_id for cr in result.systems[0].case_results] == ["case_1", "case_2", "case_3"]
+        assert result.systems[0].aggregates["exact_match_rate"] == 1.0
+    
+    def test_disabled_by_default(
+        self, httpx_mock: HTTPXMock, simple_spec, repeated_cases, system
+    ):
+        """Every case is sent when dedupe is not requested."""
+        httpx_mock.add_callback(TestConcurrency._echo_answer, is_reusable=True)
+        
+        run_benchmark(simple_spec, repeated_cases, [system])
+        
+        assert len(httpx_mock.get_requests()) == 3
+    
+    def test_identical_inputs_sent_once_concurrently(
+        self, httpx_mock: HTTPXMock, simple_spec, system
+    ):
+        """Concurrent cases with the same input wait on the first request."""
+        def slow_answer(request: httpx.Request) -> httpx.Response:
+            # Hold the response so every worker reaches the cache meanwhile
+            time.sleep(0.05)
+            return TestConcurrency._echo_answer(request)
+        
+        httpx_mock.add_callback(slow_answer, is_reusable=True)
+        cases = [
+            Case(id=f"case_{i}", input={"question": "1+1"}, reference={"answer": "2"})
+            for i in range(8)
+        ]
+        
+        result = run_benchmark(
+            simple_spec, cases, [system], concurrency=4, dedupe_requests=True
+        )
+        
+        assert len(httpx_mock.get_requests()) == 1
+        assert result.systems[0].aggregates["exact_match_rate"] == 1.0
+    
+    def test_errors_not_reused(
+        self, httpx_mock: HTTPXMock, simple_spec, repeated_cases, system
+    ):
+        """A failed request is retried for the next case with the same input."""
+        httpx_mock.add_response(status_code=500)
+        httpx_mock.add_response(json={"answer": "2"})
+        httpx_mock.add_response(json={"answer": "4"})
+        
+        result = run_benchmark(simple_spec, repeated_cases, [system], dedupe_requests=True)
+        
+        case_results = result.systems[0].case_results
+        assert case_results[0].error.code == "http_error"
+        assert case_results[1].metrics["exact_match"] is True
+        assert case_results[2].metrics["exact_match"] is True
+
+
 class TestResultModels:
     """Tests for result model structures."""
     
@@ -1,7 +1,9 @@
 """Tests for benchmark spec loading and validation."""
 
 import pytest
+import yaml
 from pathlib import Path
+from pydantic import ValidationError
 
 from engine.spec import load_spec, BenchmarkSpec, SpecLoadError
 
@@ -10,36 +12,84 @@ from engine.spec import load_spec, BenchmarkSpec, SpecLoadError
 FIXTURE_SPEC = Path(__file__).parent.parent / "benchmarks" / "addition_qa_v1" / "benchmark.yaml"
 
 
+# Minimal valid YAML spec; tests override single fields to make it invalid
+_SPEC_TEMPLATE = """
+id: test
+name: Test
+version: 1
+dataset:
+  path: data.jsonl
+contract:
+  protocol: {protocol}
+  request:
+    method: {method}
+    body_json_path: "$.input"
+  response:
+    output_json_path: "{output_json_path}"
+scoring:
+  metrics:
+    - name: exact_match
+      type: exact_match
+      args:
+        pred_path: "$"
+        ref_path: "$.answer"
+        normalize:
+          lowercase: true
+          strip_whitespace: true
+  primary_metric: exact_match
+reporting:
+  aggregate:
+    - name: exact_match_rate
+      type: mean
+      metric: exact_match
+"""
+
+
+def _spec_yaml(protocol="http", method="POST", output_json_path="$"):
+    """Render the spec template with the given contract fields."""
+    return _SPEC_TEMPLATE.format(
+        protocol=protocol,
+        method=method,
+        output_json_path=output_json_path,
+    )
+
+
+@pytest.fixture(scope="module")
+def fixture_spec():
+    """Load the fixture benchmark spec once for all tests that read it."""
+    return load_spec(FIXTURE_SPEC)
+
+
 class TestLoadSpec:
     """Tests for load_spec function."""
     
-    def test_load_valid_spec(self):
+    def test_load_valid_spec(self, fixture_spec):
         """Load the fixture benchmark spec successfully."""
-        spec = load_spec(FIXTURE_SPEC)
+        spec = fixture_spec
         
         assert isinstance(spec, BenchmarkSpec)
         assert spec.id == "addition_qa_v1"
         assert spec.name == "Addition QA Benchmark"
         assert spec.version == 1
     
-    def test_spec_dataset_config(self):
+    def test_spec_dataset_config(self, fixture_spec):
         """Verify dataset configuration is loaded correctly."""
-        spec = load_spec(FIXTURE_SPEC)
+        spec = fixture_spec
         
         assert spec.dataset.path == "dataset.jsonl"
     
-    def test_spec_contract_config(self):
+    def test_spec_contract_config(self, fixture_spec):
         """Verify contract configuration is loaded correctly."""
-        spec = load_spec(FIXTURE_SPEC)
+        spec = fixture_spec
         
         assert spec.contract.protocol == "http"
         assert spec.contract.request.method == "POST"
         assert spec.contract.request.body_json_path == "$.input"
         assert spec.contract.response.output_json_path == "$.answer"
     
-    def test_spec_scoring_config(self):
+    def test_spec_scoring_config(self, fixture_spec):
         """Verify scoring configuration is loaded correctly."""
-        spec = load_spec(FIXTURE_SPEC)
+        spec = fixture_spec
         
         assert spec.scoring.primary_metric == "exact_match"
         assert len(spec.scoring.metrics) == 1
@@ -52,9 +102,9 @@ class TestLoadSpec:
         assert metric.args.normalize.lowercase is True
         assert metric.args.normalize.strip_whitespace is True
     
-    def test_spec_reporting_config(self):
+    def test_spec_reporting_config(self, fixture_spec):
         """Verify reporting configuration is loaded correctly."""
-        spec = load_spec(FIXTURE_SPEC)
+        spec = fixture_spec
         
         assert len(spec.reporting.aggregate) == 1
         
@@ -84,6 +134,22 @@ class TestLoadSpec:
         with pytest.raises(SpecLoadError, match="empty"):
             load_spec(empty_file)
     
+    def test_invalid_json(self, tmp_path):
+        """Raise SpecLoadError for a malformed .json spec."""
+        bad_file = tmp_path / "bad.json"
+        bad_file.write_text('{"id": "test",')
+        
+        with pytest.raises(SpecLoadError, match="parse"):
+            load_spec(bad_file)
+    
+    def test_empty_json_file(self, tmp_path):
+        """Raise SpecLoadError for an empty .json spec."""
+        empty_file = tmp_path / "empty.json"
+        empty_file.write_text("")
+        
+        with pytest.raises(SpecLoadError, match="empty"):
+            load_spec(empty_file)
+    
     def test_missing_required_field(self, tmp_path):
         """Raise SpecLoadError when required field is missing."""
         incomplete = tmp_path / "incomplete.yaml"
@@ -95,36 +161,7 @@ class TestLoadSpec:
     def test_invalid_protocol(self, tmp_path):
         """Raise SpecLoadError for invalid protocol."""
         bad_spec = tmp_path / "bad_protocol.yaml"
-        bad_spec.write_text("""
-id: test
-name: Test
-version: 1
-dataset:
-  path: data.jsonl
-contract:
-  protocol: grpc
-  request:
-    method: POST
-    body_json_path: "$.input"
-  response:
-    output_json_path: "$"
-scoring:
-  metrics:
-    - name: exact_match
-      type: exact_match
-      args:
-        pred_path: "$"
-        ref_path: "$.answer"
-        normalize:
-          lowercase: true
-          strip_whitespace: true
-  primary_metric: exact_match
-reporting:
-  aggregate:
-    - name: exact_match_rate
-      type: mean
-      metric: exact_match
-""")
+        bad_spec.write_text(_spec_yaml(protocol="grpc"))
         
         with pytest.raises(SpecLoadError, match="Invalid spec"):
             load_spec(bad_spec)
@@ -132,40 +169,27 @@ reporting:
     def test_invalid_method(self, tmp_path):
         """Raise SpecLoadError for non-POST method."""
         bad_spec = tmp_path / "bad_method.yaml"
-        bad_spec.write_text("""
-id: test
-name: Test
-version: 1
-dataset:
-  path: data.jsonl
-contract:
-  protocol: http
-  request:
-    method: GET
-    body_json_path: "$.input"
-  response:
-    output_json_path: "$"
-scoring:
-  metrics:
-    - name: exact_match
-      type: exact_match
-      args:
-        pred_path: "$"
-        ref_path: "$.answer"
-        normalize:
-          lowercase: true
-          strip_whitespace: true
-  primary_metric: exact_match
-reporting:
-  aggregate:
-    - name: exact_match_rate
-      type: mean
-      metric: exact_match
-""")
+        bad_spec.write_text(_spec_yaml(method="GET"))
         
         with pytest.raises(SpecLoadError, match="Invalid spec"):
             load_spec(bad_spec)
     
+    def test_invalid_json_path(self, tmp_path):
+        """Raise SpecLoadError for unsupported JSONPath syntax."""
+        bad_spec = tmp_path / "bad_path.yaml"
+        bad_spec.write_text(_spec_yaml(output_json_path="$.items[0]"))
+        
+        with pytest.raises(SpecLoadError, match=r"contract\.response\.output_json_path"):
+            load_spec(bad_spec)
+    
+    def test_model_validate_rejects_invalid_metric_path(self):
+        """Metric paths are checked by the model itself, not only by load_spec."""
+        data = yaml.safe_load(_spec_yaml())
+        data["scoring"]["metrics"][0]["args"]["ref_path"] = "$.answers[0]"
+        
+        with pytest.raises(ValidationError, match=r"scoring\.metrics\.0\.args\.ref_path"):
+            BenchmarkSpec.model_validate(data)
+    
     def test_load_json_spec(self, tmp_path):
         """Load a valid spec from JSON format."""
         json_spec = tmp_path / "spec.json"
@@ -1,10 +1,13 @@
 """Tests for system invocation."""
 
+import json
+import math
+
 import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
-from engine.systems import SystemConfig, invoke_case, InvokeError
+from engine.systems import SystemConfig, close_shared_client, invoke_case, InvokeError
 
 
 class TestSystemConfig:
@@ -68,6 +71,17 @@ class TestInvokeCase:
         
         assert result == response_data
     
+    def test_parses_like_stdlib_json(self, httpx_mock: HTTPXMock):
+        """Big integers and non-finite numbers come back as json.loads reads them."""
+        content = b'{"answer": 123456789012345678901234567890, "score": NaN}'
+        httpx_mock.add_response(content=content)
+        
+        system = SystemConfig(name="test", endpoint="http://test.local/api")
+        result = invoke_case(system, {})
+        
+        assert result["answer"] == json.loads(content)["answer"]
+        assert math.isnan(result["score"])
+    
     def test_returns_array_response(self, httpx_mock: HTTPXMock):
         """Returns array JSON response."""
         httpx_mock.add_response(json=[1, 2, 3])
@@ -77,6 +91,30 @@ class TestInvokeCase:
         
         assert result == [1, 2, 3]
     
+    def test_uses_shared_client(self, httpx_mock: HTTPXMock):
+        """Requests go through a provided client and reuse it across calls."""
+        httpx_mock.add_response(json={"answer": "4"}, is_reusable=True)
+        
+        system = SystemConfig(name="test", endpoint="http://test.local/solve")
+        with httpx.Client() as client:
+            first = invoke_case(system, {"question": "2+2"}, client)
+            second = invoke_case(system, {"question": "2+2"}, client)
+        
+        assert first == second == {"answer": "4"}
+        assert len(httpx_mock.get_requests()) == 2
+    
+    def test_default_client_reused_and_recreated_after_close(self, httpx_mock: HTTPXMock):
+        """Calls without a client share one, which can be closed and recreated."""
+        httpx_mock.add_response(json={"answer": "4"}, is_reusable=True)
+        
+        system = SystemConfig(name="test", endpoint="http://test.local/solve")
+        invoke_case(system, {})
+        invoke_case(system, {})
+        close_shared_client()
+        
+        assert invoke_case(system, {}) == {"answer": "4"}
+        assert len(httpx_mock.get_requests()) == 3
+    
     # --- HTTP errors ---
     
     def test_http_404_error(self, httpx_mock: HTTPXMock):
@@ -153,6 +191,18 @@ class TestInvokeCase:
         
         assert exc_info.value.code == "invalid_json"
     
+    def test_deeply_nested_response_invalid_json(self, httpx_mock: HTTPXMock):
+        """JSON nested too deeply to parse raises invalid_json error."""
+        depth = 200_000
+        httpx_mock.add_response(content=b"[" * depth + b"]" * depth)
+        
+        system = SystemConfig(name="test", endpoint="http://test.local/api")
+        
+        with pytest.raises(InvokeError) as exc_info:
+            invoke_case(system, {})
+        
+        assert exc_info.value.code == "invalid_json"
+    
     # --- Error attributes ---
     
     def test_error_includes_endpoint(self, httpx_mock: HTTPXMock):
@@ -194,4 +244,17 @@ class TestInvokeCase:
         assert exc_info.value.code == "timeout"
         assert exc_info.value.http_status is None
         assert "timed out" in exc_info.value.message
+    
+    def test_custom_timeout(self, httpx_mock: HTTPXMock):
+        """The timeout argument is sent with the request and reported on expiry."""
+        httpx_mock.add_exception(httpx.TimeoutException("Read timed out"))
+        
+        system = SystemConfig(name="test", endpoint="http://test.local/api")
+        
+        with pytest.raises(InvokeError) as exc_info:
+            invoke_case(system, {}, timeout=0.5)
+        
+        assert exc_info.value.code == "timeout"
+        assert "timed out after 0.5s" in exc_info.value.message
+        assert httpx_mock.get_request().extensions["timeout"]["read"] == 0.5
 